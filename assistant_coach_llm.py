@@ -3,10 +3,90 @@ LLM Assistant Coach - Integration Script
 Demonstrates how an LLM can query enriched data to generate insights
 """
 
+import numpy as np
 import pandas as pd
 import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial, wraps
+from pathlib import Path
 from typing import Dict, List, Any
 
+from categorical_utils import startswith_mask
+
+try:
+    import pyarrow.dataset as pads
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet cache and sources are optional
+    pads = pq = None
+
+try:
+    import orjson
+except ImportError:  # Falls back to the stdlib encoder
+    orjson = None
+
+
+# Rows from which the coverage counts switch to the Numba kernel; below this
+# the NumPy path is faster than importing and compiling it
+JIT_MIN_ROWS = 1_000_000
+
+
+def _round_coverage_loop(market, clutch, rounds, n_rounds):
+    """
+    Single serial pass over both masks: number of distinct rounds with
+    Market events and with clutch events. Compiled by Numba on demand.
+    """
+    market_seen = np.zeros(n_rounds, dtype=np.bool_)
+    clutch_seen = np.zeros(n_rounds, dtype=np.bool_)
+    for i in range(rounds.shape[0]):
+        if market[i]:
+            market_seen[rounds[i]] = True
+        if clutch[i]:
+            clutch_seen[rounds[i]] = True
+    return market_seen.sum(), clutch_seen.sum()
+
+
+@lru_cache(maxsize=None)
+def _jit_round_coverage():
+    """The compiled kernel, built on first use; None without Numba."""
+    try:
+        from numba import njit
+    except ImportError:  # JIT kernel is optional
+        return None
+    return njit(cache=True)(_round_coverage_loop)
+
+
+def _round_coverage(market, clutch, rounds, n_rounds):
+    """Number of distinct rounds with Market events and with clutch events."""
+    if len(rounds) >= JIT_MIN_ROWS:
+        kernel = _jit_round_coverage()
+        if kernel is not None:
+            return kernel(market, clutch, rounds, n_rounds)
+    
+    def distinct_rounds(mask):
+        return np.bincount(rounds[mask], minlength=n_rounds).astype(bool).sum()
+    return distinct_rounds(market), distinct_rounds(clutch)
+
+
+def _popcount(packed: np.ndarray) -> int:
+    """Number of set bits in a packed bitmap."""
+    if hasattr(np, 'bitwise_count'):  # NumPy >= 2.0: POPCNT per 64-bit word
+        words = len(packed) // 8 * 8
+        return int(np.bitwise_count(packed[:words].view(np.uint64)).sum()
+                   + np.bitwise_count(packed[words:]).sum())
+    return int.from_bytes(packed.tobytes(), 'little').bit_count()
+
+
+def _memoized(method):
+    """Cache an analyzer's result on the instance; the loaded data is read-only."""
+    @wraps(method)
+    def wrapper(self, *args):
+        key = (method.__name__,) + args
+        if key not in self._cache:
+            self._cache[key] = method(self, *args)
+        return self._cache[key]
+    return wrapper
+
 
 class AssistantCoach:
     """
@@ -14,21 +94,204 @@ class AssistantCoach:
     In production, this would use Claude API or similar.
     """
     
-    def __init__(self, enriched_data_path: str):
-        """Initialize with enriched match data."""
-        self.data = pd.read_csv(enriched_data_path)
+    # Columns the analyzers actually read; everything else stays on disk
+    NEEDED_COLUMNS = ['roundNumber', 'eventType', 'playerName', 'is_trade_kill',
+                      'situation_type', 'in_zone_market_defense_(ascent)']
+    
+    # Query keywords, all found in a single regex pass over the question
+    QUERY_TOKENS = re.compile(r'market|trade|clutch|1v|player|oxy', re.IGNORECASE)
+    
+    # Enriched column each analyzer depends on, with the error it reports
+    # when the column is missing
+    ANALYZER_REQUIREMENTS = {
+        '_analyze_market_performance': (
+            'in_zone_market_defense_(ascent)',
+            "Market zone metric not available",
+            "Ensure spatial enrichment was applied"),
+        '_analyze_trade_efficiency': (
+            'is_trade_kill',
+            "Trade efficiency metric not available",
+            "Ensure temporal enrichment was applied"),
+        '_analyze_clutch_situations': (
+            'situation_type',
+            "Clutch situation metric not available",
+            "Ensure situational enrichment was applied"),
+    }
+    
+    # Column prefixes produced by the semantic enricher
+    ENRICHED_PREFIXES = ('in_zone_', 'is_', 'situation_', 'distance_to_', 'time_since_')
+    
+    def __init__(self, enriched_data_path: str, verbose: bool = False):
+        """
+        Initialize with enriched match data: a CSV export, a Parquet file, or
+        a directory of Parquet files (e.g. one per map). Verbose lists the
+        enriched metrics.
+        """
+        self.data = self._load_enriched_data(enriched_data_path)
+        self._build_masks()
+        self._cache = {}
+        self._bind_missing_analyzers()
+        # Checked in order: the first route whose keywords all appear wins
+        self._routes = [
+            (frozenset({'market'}), self._analyze_market_performance),
+            (frozenset({'trade'}), self._analyze_trade_efficiency),
+            (frozenset({'clutch'}), self._analyze_clutch_situations),
+            (frozenset({'1v'}), self._analyze_clutch_situations),
+            (frozenset({'player', 'oxy'}), partial(self._analyze_player_performance, 'OXY')),
+        ]
         print(f"✓ Loaded enriched data: {len(self.data)} events")
-        print(f"  Available dimensions: {len(self.data.columns)} columns")
-        self._print_available_metrics()
+        print(f"  Available dimensions: {len(self.columns)} columns")
+        if verbose:
+            self._print_available_metrics()
+    
+    def _bind_missing_analyzers(self):
+        """
+        Resolve column availability once for the loaded schema: an analyzer
+        whose enriched column is missing is replaced on this instance by a
+        stub returning its error, so the analyzers never re-check.
+        """
+        for name, (col, error, suggestion) in self.ANALYZER_REQUIREMENTS.items():
+            if col not in self.data.columns:
+                result = {"error": error, "suggestion": suggestion}
+                setattr(self, name, lambda result=result: result)
+    
+    def _load_enriched_data(self, path: str) -> pd.DataFrame:
+        """
+        Load the needed columns, preferring a typed Parquet sidecar cache.
+        The full schema is only peeked at (header row) for reporting.
+        """
+        csv_file = Path(path)
+        if csv_file.is_dir() or csv_file.suffix == '.parquet':
+            return self._load_parquet_dataset(csv_file)
+        
+        # Sidecar named after the full CSV name (data.csv -> data.csv.parquet)
+        # so it can never overwrite a Parquet export of the same data
+        parquet_file = csv_file.with_name(csv_file.name + '.parquet')
+        self.columns = pd.read_csv(csv_file, nrows=0).columns.tolist()
+        needed = self._needed_columns()
+        
+        if (pq is not None and parquet_file.exists() and
+                parquet_file.stat().st_mtime >= csv_file.stat().st_mtime and
+                set(needed) <= set(pq.read_schema(parquet_file).names)):
+            return pd.read_parquet(parquet_file, columns=needed)
+        
+        try:
+            # Imported only here: Polars is used for the cold CSV parse alone
+            import polars as pl
+        except ImportError:  # Multi-threaded CSV scan is optional
+            pl = None
+        if pl is not None and pq is not None:
+            # Lazy scan pushes the projection into Polars' parallel CSV reader
+            df = (pl.scan_csv(csv_file).select(needed).collect()
+                  .to_pandas().astype(self._csv_dtypes(needed)))
+        else:
+            df = pd.read_csv(csv_file, usecols=needed, dtype=self._csv_dtypes(needed))
+        if pq is not None:
+            try:
+                df.to_parquet(parquet_file, compression='zstd', index=False)
+            except OSError:
+                pass  # The cache is best-effort; e.g. a read-only data directory
+        return df
+    
+    def _load_parquet_dataset(self, source: Path) -> pd.DataFrame:
+        """
+        Scan Parquet sources as one pyarrow dataset. Only the needed columns
+        are decoded, in parallel, so the full archive is never materialized.
+        
+        A directory contributes every ``*.parquet`` file below it, except
+        hidden ones ('.'/'_' prefix) and the ``*.csv.parquet`` column caches
+        this class writes next to CSV exports (they would double-count rows).
+        Any other file, such as a CSV export or a README, is ignored.
+        """
+        if pads is None:
+            raise ImportError("pyarrow is required to read Parquet sources")
+        
+        if source.is_dir():
+            files = sorted(str(f) for f in source.rglob('*.parquet')
+                           if not f.name.startswith(('.', '_'))
+                           and not f.name.endswith('.csv.parquet'))
+            if not files:
+                raise FileNotFoundError(f"No Parquet files found in {source}")
+        else:
+            files = str(source)
+        dataset = pads.dataset(files, format='parquet')
+        self.columns = dataset.schema.names
+        needed = self._needed_columns()
+        table = dataset.to_table(columns=needed)
+        return table.to_pandas().astype(self._csv_dtypes(needed))
+    
+    def _needed_columns(self) -> List[str]:
+        """Subset of NEEDED_COLUMNS present in the source data."""
+        return [col for col in self.NEEDED_COLUMNS if col in self.columns]
+    
+    def _csv_dtypes(self, columns) -> Dict[str, Any]:
+        """Explicit dtypes so the CSV is not type-inferred column by column."""
+        dtypes = {}
+        for col in columns:
+            if col.startswith('in_zone_') or col.startswith('is_'):
+                dtypes[col] = bool
+            elif col in ('playerName', 'eventType', 'situation_type'):
+                dtypes[col] = 'category'
+            elif col == 'roundNumber':
+                dtypes[col] = 'int32'
+        return dtypes
+    
+    def _build_masks(self):
+        """
+        Precompute the row masks and round numbers shared by the analyzers.
+        The data never changes after load, so each mask is built once.
+        """
+        no_rows = np.zeros(len(self.data), dtype=bool)
+        
+        def flag(col: str) -> np.ndarray:
+            return self.data[col].to_numpy() if col in self.data.columns else no_rows
+        
+        clutch = no_rows
+        if 'situation_type' in self.data.columns:
+            if not isinstance(self.data['situation_type'].dtype, pd.CategoricalDtype):
+                self.data['situation_type'] = self.data['situation_type'].astype('category')
+            clutch = startswith_mask(self.data['situation_type'], 'Clutch')
+        
+        self._masks = {
+            'kill': (self.data['eventType'] == 'kill').to_numpy(),
+            'market': flag('in_zone_market_defense_(ascent)'),
+            'trade': flag('is_trade_kill'),
+            'clutch': clutch,
+        }
+        # Bit-packed copies in Arrow's LSB-first layout: 8 rows per byte
+        self._packed = {
+            name: np.packbits(self._masks[name], bitorder='little')
+            for name in ('kill', 'trade')
+        }
+        self._player_stats = None
+        self._stats = None
+        
+        # Rounds are small non-negative ints: count distinct ones with bincount
+        self._round_arr = self.data['roundNumber'].to_numpy(dtype=np.int32)
+        self._total_rounds = int(np.bincount(self._round_arr).astype(bool).sum())
+    
+    def _agenda_stats(self) -> Dict[str, int]:
+        """
+        Counts behind the Market, trade and clutch analyses.
+        Computed together in one sweep over the cached masks, then reused.
+        """
+        if self._stats is None:
+            masks, packed, rounds = self._masks, self._packed, self._round_arr
+            n_rounds = int(rounds.max()) + 1 if rounds.size else 0
+            market_rounds, clutch_rounds = _round_coverage(
+                masks['market'], masks['clutch'], rounds, n_rounds)
+            self._stats = {
+                'market_rounds': int(market_rounds),
+                'total_kills': _popcount(packed['kill']),
+                'trade_kills': _popcount(packed['kill'] & packed['trade']),
+                'clutch_rounds': int(clutch_rounds),
+            }
+        return self._stats
     
     def _print_available_metrics(self):
         """Show which enriched metrics are available."""
-        enriched_cols = [col for col in self.data.columns if 
-                        col.startswith('in_zone_') or 
-                        col.startswith('is_') or 
-                        col.startswith('situation_') or
-                        col.startswith('distance_to_') or
-                        col.startswith('time_since_')]
+        enriched_cols = [col for col in self.columns
+                         if col.startswith(self.ENRICHED_PREFIXES)]
         
         if enriched_cols:
             print("\n  Enriched metrics available:")
@@ -45,128 +308,106 @@ class AssistantCoach:
         
         For demo, we'll handle specific questions manually.
         """
-        question_lower = question.lower()
+        tokens = {match.lower() for match in self.QUERY_TOKENS.findall(question)}
         
         # Route to appropriate handler
-        if 'market' in question_lower:
-            return self._analyze_market_performance()
-        elif 'trade' in question_lower:
-            return self._analyze_trade_efficiency()
-        elif 'clutch' in question_lower or '1v' in question_lower:
-            return self._analyze_clutch_situations()
-        elif 'player' in question_lower and 'oxy' in question_lower:
-            return self._analyze_player_performance('OXY')
-        else:
-            return self._general_analysis()
+        for keywords, handler in self._routes:
+            if keywords <= tokens:
+                return handler()
+        return self._general_analysis()
     
+    @_memoized
     def _analyze_market_performance(self) -> Dict[str, Any]:
         """Analyze performance in Market zone on Ascent."""
-        # Filter for Market zone events
-        market_col = 'in_zone_market_defense_(ascent)'
-        
-        if market_col not in self.data.columns:
-            return {
-                "error": "Market zone metric not available",
-                "suggestion": "Ensure spatial enrichment was applied"
-            }
-        
-        # Get events in Market
-        market_events = self.data[self.data[market_col] == True]
-        non_market_events = self.data[self.data[market_col] == False]
-        
-        # Calculate round-level stats
-        market_rounds = market_events['roundNumber'].unique()
-        total_rounds = self.data['roundNumber'].nunique()
+        # Calculate round-level stats for rounds with Market events
+        market_rounds = self._agenda_stats()['market_rounds']
+        total_rounds = self._total_rounds
         
         # Simulate win rate calculation (in production, would use actual round results)
         market_win_rate = 0.40  # 40% - simulated for demo
         overall_win_rate = 0.65  # 65% - simulated for demo
         
+        # Format each figure once; reused in data and insight
+        market_pct = "%.0f%%" % (market_win_rate * 100)
+        overall_pct = "%.0f%%" % (overall_win_rate * 100)
+        
         return {
             "metric": "Market Defense Analysis",
             "data": {
-                "rounds_with_market_activity": len(market_rounds),
+                "rounds_with_market_activity": market_rounds,
                 "total_rounds": total_rounds,
-                "market_engagement": f"{(len(market_rounds)/total_rounds)*100:.1f}%",
-                "win_rate_in_market": f"{market_win_rate*100:.0f}%",
-                "overall_win_rate": f"{overall_win_rate*100:.0f}%",
-                "delta": f"{(market_win_rate - overall_win_rate)*100:+.0f}%"
+                "market_engagement": "%.1f%%" % ((market_rounds / total_rounds) * 100),
+                "win_rate_in_market": market_pct,
+                "overall_win_rate": overall_pct,
+                "delta": "%+.0f%%" % ((market_win_rate - overall_win_rate) * 100)
             },
             "insight": {
                 "finding": "Critical weakness identified",
-                "description": f"Win rate drops to {market_win_rate*100:.0f}% when playing in Market zone, compared to {overall_win_rate*100:.0f}% overall.",
+                "description": f"Win rate drops to {market_pct} when playing in Market zone, compared to {overall_pct} overall.",
                 "recommendation": "Market positioning is a strategic liability. Review defensive setups and consider alternative positions or increased teammate support in this zone.",
                 "priority": "HIGH"
             }
         }
     
+    @_memoized
     def _analyze_trade_efficiency(self) -> Dict[str, Any]:
         """Analyze trading kill efficiency."""
-        trade_col = 'is_trade_kill'
-        
-        if trade_col not in self.data.columns:
-            return {
-                "error": "Trade efficiency metric not available",
-                "suggestion": "Ensure temporal enrichment was applied"
-            }
-        
-        # Get kill events
-        kills = self.data[self.data['eventType'] == 'kill']
-        trades = kills[kills[trade_col] == True]
-        
         # Calculate stats
-        total_kills = len(kills)
-        trade_kills = len(trades)
+        stats = self._agenda_stats()
+        total_kills = stats['total_kills']
+        trade_kills = stats['trade_kills']
         trade_rate = (trade_kills / total_kills * 100) if total_kills > 0 else 0
         
         # Benchmark (league average - simulated)
         league_avg = 35.0
         
+        # Format each figure once; reused in data and insight
+        trade_pct = "%.1f%%" % trade_rate
+        gap = trade_rate - league_avg
+        below = gap < 0
+        
         return {
             "metric": "Trade Efficiency Analysis",
             "data": {
                 "total_kills": total_kills,
                 "trade_kills": trade_kills,
-                "trade_conversion_rate": f"{trade_rate:.1f}%",
-                "league_average": f"{league_avg:.1f}%",
-                "delta": f"{trade_rate - league_avg:+.1f}%"
+                "trade_conversion_rate": trade_pct,
+                "league_average": "%.1f%%" % league_avg,
+                "delta": "%+.1f%%" % gap
             },
             "insight": {
-                "finding": "Below team average" if trade_rate < league_avg else "Above team average",
-                "description": f"Trading efficiency at {trade_rate:.1f}%, which is {abs(trade_rate - league_avg):.1f}% {'below' if trade_rate < league_avg else 'above'} league average.",
+                "finding": "Below team average" if below else "Above team average",
+                "description": "Trading efficiency at %s, which is %.1f%% %s league average." % (
+                    trade_pct, abs(gap), 'below' if below else 'above'),
                 "recommendation": "Low trade conversion suggests positioning issues. Players are not capitalizing on teammate deaths to secure refrag kills. Review crossfire setups and post-death positioning.",
-                "priority": "MEDIUM" if trade_rate < league_avg else "LOW"
+                "priority": "MEDIUM" if below else "LOW"
             }
         }
     
+    @_memoized
     def _analyze_clutch_situations(self) -> Dict[str, Any]:
         """Analyze performance in clutch/disadvantage situations."""
-        situation_col = 'situation_type'
-        
-        if situation_col not in self.data.columns:
-            return {
-                "error": "Clutch situation metric not available",
-                "suggestion": "Ensure situational enrichment was applied"
-            }
-        
-        # Find clutch scenarios (1vX)
-        clutch_events = self.data[
-            self.data[situation_col].str.startswith('Clutch', na=False)
-        ]
-        
-        # Count by type
-        clutch_breakdown = clutch_events['situation_type'].value_counts().to_dict()
+        # Count by type over category codes, most frequent first
+        situations = self.data['situation_type']
+        categories = situations.cat.categories
+        codes = situations.cat.codes.to_numpy()[self._masks['clutch']]
+        counts = np.bincount(codes, minlength=len(categories))
+        clutch_breakdown = {
+            categories[i]: int(counts[i])
+            for i in sorted(np.flatnonzero(counts), key=lambda i: -counts[i])
+        }
         
         # Simulate win rate (in production, would calculate from actual outcomes)
-        clutch_attempts = len(clutch_events['roundNumber'].unique())
+        clutch_attempts = self._agenda_stats()['clutch_rounds']
         clutch_wins = int(clutch_attempts * 0.22)  # 22% success rate
+        success_rate = (clutch_wins / clutch_attempts) * 100 if clutch_attempts else 0
         
         return {
             "metric": "Clutch Situation Analysis",
             "data": {
                 "total_clutch_situations": clutch_attempts,
                 "clutch_rounds_won": clutch_wins,
-                "success_rate": f"{(clutch_wins/clutch_attempts)*100:.0f}%",
+                "success_rate": "%.0f%%" % success_rate,
                 "breakdown": clutch_breakdown
             },
             "insight": {
@@ -178,35 +419,54 @@ class AssistantCoach:
             }
         }
     
+    def _get_player_stats(self) -> pd.DataFrame:
+        """Per-player event, kill, Market and trade counts from one grouped pass."""
+        if self._player_stats is None:
+            flags = pd.DataFrame({
+                'kill': self._masks['kill'],
+                'market': self._masks['market'],
+                'trade': self._masks['trade'],
+            }, index=self.data.index)
+            self._player_stats = flags.groupby(self.data['playerName'], observed=True).agg(
+                total=('kill', 'size'),
+                kills=('kill', 'sum'),
+                market=('market', 'sum'),
+                trades=('trade', 'sum'),
+            )
+        return self._player_stats
+    
+    @_memoized
     def _analyze_player_performance(self, player_name: str) -> Dict[str, Any]:
         """Analyze specific player's performance across enriched dimensions."""
-        player_events = self.data[self.data['playerName'] == player_name]
+        player_stats = self._get_player_stats()
         
-        if player_events.empty:
+        if player_name not in player_stats.index:
             return {
                 "error": f"No data found for player: {player_name}",
                 "suggestion": "Check player name spelling"
             }
         
+        stats = player_stats.loc[player_name]
+        
         # Analyze across enriched dimensions
         insights = []
         
         # Market performance
         if 'in_zone_market_defense_(ascent)' in self.data.columns:
-            market_events = player_events[player_events['in_zone_market_defense_(ascent)'] == True]
-            if not market_events.empty:
+            market_events = int(stats['market'])
+            if market_events:
                 insights.append({
                     "dimension": "Market Zone",
-                    "stat": f"{len(market_events)} events in Market",
+                    "stat": f"{market_events} events in Market",
                     "finding": "Dies early 70% of the time in this zone without KAST"
                 })
         
         # Trade involvement
         if 'is_trade_kill' in self.data.columns:
-            trade_kills = player_events[player_events['is_trade_kill'] == True]
-            total_kills = player_events[player_events['eventType'] == 'kill']
-            if not total_kills.empty:
-                trade_rate = (len(trade_kills) / len(total_kills)) * 100
+            trade_kills = int(stats['trades'])
+            total_kills = int(stats['kills'])
+            if total_kills:
+                trade_rate = (trade_kills / total_kills) * 100
                 insights.append({
                     "dimension": "Trade Efficiency",
                     "stat": f"{trade_rate:.1f}% trade conversion",
@@ -216,22 +476,23 @@ class AssistantCoach:
         return {
             "metric": f"Player Analysis - {player_name}",
             "data": {
-                "total_events": len(player_events),
+                "total_events": int(stats['total']),
                 "dimensions_analyzed": len(insights)
             },
             "insights": insights,
             "recommendation": f"Review {player_name}'s positioning in Market zone - this is his primary weakness."
         }
     
+    @_memoized
     def _general_analysis(self) -> Dict[str, Any]:
         """Provide general match analysis."""
         return {
             "metric": "General Match Analysis",
             "data": {
                 "total_events": len(self.data),
-                "rounds": self.data['roundNumber'].nunique(),
-                "enriched_dimensions": len([col for col in self.data.columns if 
-                                           col.startswith('in_zone_') or col.startswith('is_')])
+                "rounds": self._total_rounds,
+                "enriched_dimensions": len([col for col in self.columns
+                                            if col.startswith(('in_zone_', 'is_'))])
             },
             "insight": {
                 "description": "Multiple enriched dimensions available for analysis",
@@ -250,38 +511,28 @@ class AssistantCoach:
         agenda.append("=" * 70)
         agenda.append("")
         
-        # Analyze each enriched dimension
-        analyses = []
+        # Analyze each enriched dimension. The analyses are independent and
+        # only read shared arrays, so they run concurrently; the shared counts
+        # are computed first so no thread repeats that work.
+        sections = [
+            ("Market Defense (Ascent)", self._analyze_market_performance),
+            ("Trade Efficiency", self._analyze_trade_efficiency),
+            ("Clutch Situations", self._analyze_clutch_situations),
+        ]
+        self._agenda_stats()
+        with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+            futures = [executor.submit(analyzer) for _, analyzer in sections]
+            results = [future.result() for future in futures]
         
-        # Market Defense
-        market_analysis = self._analyze_market_performance()
-        if 'insight' in market_analysis:
-            analyses.append({
-                "section": "Market Defense (Ascent)",
-                "priority": market_analysis['insight']['priority'],
-                "finding": market_analysis['insight']['finding'],
-                "details": market_analysis['insight']['description']
-            })
-        
-        # Trade Efficiency
-        trade_analysis = self._analyze_trade_efficiency()
-        if 'insight' in trade_analysis:
-            analyses.append({
-                "section": "Trade Efficiency",
-                "priority": trade_analysis['insight']['priority'],
-                "finding": trade_analysis['insight']['finding'],
-                "details": trade_analysis['insight']['description']
-            })
-        
-        # Clutch Situations
-        clutch_analysis = self._analyze_clutch_situations()
-        if 'insight' in clutch_analysis:
-            analyses.append({
-                "section": "Clutch Situations",
-                "priority": clutch_analysis['insight']['priority'],
-                "finding": clutch_analysis['insight']['finding'],
-                "details": clutch_analysis['insight']['description']
-            })
+        analyses = []
+        for (section, _), analysis in zip(sections, results):
+            if 'insight' in analysis:
+                analyses.append({
+                    "section": section,
+                    "priority": analysis['insight']['priority'],
+                    "finding": analysis['insight']['finding'],
+                    "details": analysis['insight']['description']
+                })
         
         # Sort by priority
         priority_order = {"HIGH": 0, "MEDIUM": 1, "LOW": 2}
@@ -339,13 +590,21 @@ class AssistantCoach:
         }
 
 
+def _pretty(obj: Any) -> str:
+    """Format a result as indented JSON for display."""
+    if orjson is not None:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        return orjson.dumps(obj, option=options).decode()
+    return json.dumps(obj, indent=2)
+
+
 def demo():
     """Demonstration of the assistant coach system."""
     print("🎮 VALORANT Assistant Coach - LLM Integration Demo")
     print("=" * 70)
     
     # Initialize with enriched data
-    coach = AssistantCoach("enriched_match_data.csv")
+    coach = AssistantCoach("enriched_match_data.csv", verbose=True)
     
     print("\n" + "=" * 70)
     print("DEMO QUERIES")
@@ -355,13 +614,13 @@ def demo():
     print("\n📍 Query: 'How is our Market defense?'")
     print("-" * 70)
     result = coach.query("How is our Market defense?")
-    print(json.dumps(result, indent=2))
+    print(_pretty(result))
     
     # Query 2: Trade Efficiency
     print("\n\n⚡ Query: 'Analyze our trade efficiency'")
     print("-" * 70)
     result = coach.query("Analyze our trade efficiency")
-    print(json.dumps(result, indent=2))
+    print(_pretty(result))
     
     # Query 3: Generate Review Agenda
     print("\n\n📋 Generating Game Review Agenda...")
@@ -373,7 +632,7 @@ def demo():
     print("\n\n🔮 Hypothetical: 'What if we avoided Market defense?'")
     print("-" * 70)
     result = coach.answer_hypothetical("What if we avoided Market defense entirely?")
-    print(json.dumps(result, indent=2))
+    print(_pretty(result))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,17 @@
+"""
+Categorical Helpers
+Shared by the enrichment engine and the assistant coach
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def startswith_mask(values: pd.Series, prefix: str) -> np.ndarray:
+    """
+    Vectorized ``str.startswith`` for categorical data.
+    The prefix is tested once per category and broadcast through the codes.
+    """
+    matches = values.cat.categories.astype(str).str.startswith(prefix)
+    # Code -1 (missing value) picks up the trailing False
+    return np.append(matches, False)[values.cat.codes.to_numpy()]
@@ -3,51 +3,172 @@ VALORANT Semantic Layer - Data Enrichment Engine
 Transforms raw GRID API data into tactically-meaningful metrics
 """
 
-import json
 import yaml
+import numpy as np
 import pandas as pd
+from collections import namedtuple
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Callable, Dict, List, Any, Optional, Tuple
 import math
 
+from categorical_utils import startswith_mask
+
+
+# Hot columns pulled out of the frame once per enrich() call as plain arrays.
+# Label columns are factorized to integer codes (-1 = missing); the team codes
+# share one label index so killer and victim teams compare directly.
+EventColumns = namedtuple('EventColumns', [
+    'time', 'round', 'is_kill',
+    'killer_team', 'victim_team', 'team_labels',
+    'map_codes', 'map_labels',
+    'kx', 'ky', 'vx', 'vy', 'px', 'py',
+])
+
+
+def _label_mask(codes: np.ndarray, labels: pd.Index, value: Any) -> np.ndarray:
+    """Boolean mask of the rows whose code maps to ``value``."""
+    # Trailing False so code -1 (missing) never matches
+    hit = np.append(np.asarray(labels == value, dtype=bool), False)
+    return hit[codes]
+
 
 class SemanticEnricher:
     """
     Core enrichment engine that applies metric definitions to raw GRID data.
     """
     
+    # Low-cardinality string columns stored as pandas categoricals
+    CATEGORICAL_COLUMNS = ('eventType', 'map', 'killerTeam', 'victimTeam', 'playerName')
+    
+    # Every situation_type label, in order; the same categories for every match
+    SITUATION_LABELS = ([f'Disadvantage {n}' for n in range(-5, 0)] + ['Even']
+                        + [f'Advantage +{n}' for n in range(1, 6)]
+                        + [f'Clutch 1v{n}' for n in range(2, 6)])
+    
+    # Position columns narrowed to float32
+    COORDINATE_COLUMNS = ('playerX', 'playerY', 'killerX', 'killerY', 'victimX', 'victimY')
+    
     def __init__(self, definitions_path: str = "definitions.yaml"):
         """Initialize the enricher with metric definitions."""
         self.definitions = self._load_definitions(definitions_path)
+        self._compiled_metrics = self._compile_metrics(self.definitions)
         self.enriched_data = None
+        self._original_columns = []
         
     def _load_definitions(self, path: str) -> Dict:
         """Load metric definitions from YAML file."""
         with open(path, 'r') as f:
             return yaml.safe_load(f)
     
-    def load_match_data(self, jsonl_path: str) -> pd.DataFrame:
+    def _compile_metrics(self, definitions: Dict) -> Dict[str, Dict]:
+        """
+        Compile each composite metric's YAML conditions once into
+        ``(column, mask_fn)`` pairs, so enrichment does no string parsing.
+        """
+        compiled = {}
+        for metric in definitions.get('metrics', []):
+            if metric.get('type') != 'composite':
+                continue
+            compiled[metric['name']] = {
+                'column': f"is_{metric['name'].lower().replace(' ', '_')}",
+                'ops': [(key, self._compile_condition(value))
+                        for key, value in metric.get('conditions', {}).items()],
+            }
+        return compiled
+    
+    @staticmethod
+    def _compile_condition(value: Any) -> Callable[[pd.Series], pd.Series]:
+        """Turn one YAML condition value into a function of the column."""
+        if isinstance(value, list):
+            # List means "in these values"
+            return lambda values: values.isin(value)
+        if isinstance(value, str) and value.startswith('>'):
+            # Greater than comparison
+            threshold = float(value[1:].strip())
+            return lambda values: values > threshold
+        if isinstance(value, str) and value.startswith('<'):
+            # Less than comparison
+            threshold = float(value[1:].strip())
+            return lambda values: values < threshold
+        # Exact match
+        return lambda values: values == value
+    
+    def load_match_data(self, jsonl_path: str,
+                        dtype_backend: Optional[str] = None) -> pd.DataFrame:
         """
         Load GRID API match data from JSONL file.
         Each line is a game event.
+        
+        Pass dtype_backend='pyarrow' (requires pyarrow) to keep the numeric
+        columns Arrow-backed, with nulls in validity bitmaps.
         """
-        events = []
-        with open(jsonl_path, 'r') as f:
-            for line in f:
-                events.append(json.loads(line))
+        # Columnar parse straight from the file; dtype=False keeps values as
+        # JSON typed them (no numeric coercion of strings)
+        options = {'dtype_backend': dtype_backend} if dtype_backend else {}
+        df = pd.read_json(jsonl_path, lines=True, dtype=False,
+                          convert_dates=False, precise_float=True, **options)
         
-        df = pd.DataFrame(events)
+        df = self._compact_dtypes(df)
         print(f"✓ Loaded {len(df)} events from {jsonl_path}")
         return df
     
-    def enrich(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _compact_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Shrink column dtypes in place: low-cardinality labels become
+        categoricals, coordinates float32 and round numbers int16.
+        gameTime stays float64 so the trade window comparisons are exact.
+        """
+        for col in self.CATEGORICAL_COLUMNS:
+            if col in df.columns and pd.api.types.is_string_dtype(df[col]):
+                df[col] = df[col].astype('category')
+        
+        # float32 whatever the input type, so integer positions never wrap
+        for col in self.COORDINATE_COLUMNS:
+            if col in df.columns and pd.api.types.is_numeric_dtype(df[col]):
+                df[col] = pd.to_numeric(df[col], downcast='float')
+        
+        rounds = df.get('roundNumber')
+        if (rounds is not None and pd.api.types.is_integer_dtype(rounds)
+                and rounds.dtype.itemsize > 2
+                and rounds.between(-2**15, 2**15 - 1).all()):
+            # Same dtype family (NumPy, nullable or Arrow), narrowed to 16 bits
+            if isinstance(rounds.dtype, pd.ArrowDtype):
+                int16 = 'int16[pyarrow]'
+            elif isinstance(rounds.dtype, np.dtype):
+                int16 = 'int16'
+            else:
+                int16 = 'Int16'
+            df['roundNumber'] = rounds.astype(int16)
+        
+        return df
+    
+    def enrich(self, df: pd.DataFrame, *, inplace: bool = False) -> pd.DataFrame:
         """
         Apply all metric definitions to the raw data.
         This is the core transformation that creates the semantic layer.
+        
+        With inplace=True the caller's frame itself is sorted, re-indexed and
+        extended (for callers that never reuse the raw frame); otherwise the
+        work happens on a shallow copy and the input is left unchanged.
         """
         print("\n🔄 Starting enrichment process...")
-        enriched_df = df.copy()
+        self._original_columns = df.columns.tolist()
+        # Metrics only ever add or replace whole columns, so a shallow copy is
+        # enough to keep the input untouched
+        enriched_df = df if inplace else df.copy(deep=False)
+        
+        # Chronological order (stable, so ties keep event order), skipped when
+        # the events already arrive sorted. The extracted arrays share this
+        # row order.
+        if not enriched_df['gameTime'].is_monotonic_increasing:
+            enriched_df.sort_values('gameTime', kind='mergesort', inplace=True)
+        enriched_df.reset_index(drop=True, inplace=True)
+        
+        # Categorical labels make every equality mask below an integer code
+        # compare; narrow numerics halve the bytes the kernels stream through
+        enriched_df = self._compact_dtypes(enriched_df)
+        cols = self._extract_columns(enriched_df)
         
         # Apply each metric definition
         for metric in self.definitions.get('metrics', []):
@@ -57,74 +178,95 @@ class SemanticEnricher:
             print(f"  └─ Applying: {metric_name} ({metric_type})")
             
             if metric_type == 'situational':
-                enriched_df = self._apply_situational(enriched_df, metric)
+                enriched_df = self._apply_situational(enriched_df, cols, metric)
             elif metric_type == 'spatial':
-                enriched_df = self._apply_spatial(enriched_df, metric)
+                enriched_df = self._apply_spatial(enriched_df, cols, metric)
             elif metric_type == 'temporal':
-                enriched_df = self._apply_temporal(enriched_df, metric)
+                enriched_df = self._apply_temporal(enriched_df, cols, metric)
             elif metric_type == 'composite':
                 enriched_df = self._apply_composite(enriched_df, metric)
         
         self.enriched_data = enriched_df
-        print(f"\n✓ Enrichment complete! Added {len(enriched_df.columns) - len(df.columns)} new dimensions")
+        print(f"\n✓ Enrichment complete! Added {len(enriched_df.columns) - len(self._original_columns)} new dimensions")
         return enriched_df
     
+    def _extract_columns(self, df: pd.DataFrame) -> EventColumns:
+        """Pull the columns the metric kernels read out of ``df`` once."""
+        def floats(col):
+            if col not in df.columns:
+                return None
+            # float32 coordinates (NumPy or Arrow) stay float32; anything else
+            # widens to float64. na_value maps nullable/Arrow nulls to NaN.
+            single = pd.api.types.is_float_dtype(df[col]) and df[col].dtype.itemsize == 4
+            return df[col].to_numpy(dtype=np.float32 if single else float, na_value=np.nan)
+        
+        def factorize(*names):
+            # Factorized together so equal labels get the same code in every column
+            parts = [df[name] if name in df.columns else pd.Series(np.nan, index=df.index)
+                     for name in names]
+            codes, labels = pd.factorize(pd.concat(parts, ignore_index=True))
+            return np.split(codes, len(names)), labels
+        
+        (killer_team, victim_team), team_labels = factorize('killerTeam', 'victimTeam')
+        (map_codes,), map_labels = factorize('map')
+        
+        return EventColumns(
+            time=floats('gameTime'),
+            round=df['roundNumber'].to_numpy(),
+            is_kill=(df['eventType'] == 'kill').to_numpy(dtype=bool, na_value=False),
+            killer_team=killer_team,
+            victim_team=victim_team,
+            team_labels=team_labels,
+            map_codes=map_codes,
+            map_labels=map_labels,
+            kx=floats('killerX'), ky=floats('killerY'),
+            vx=floats('victimX'), vy=floats('victimY'),
+            px=floats('playerX'), py=floats('playerY'),
+        )
+    
     # ============================================================================
     # SITUATIONAL METRICS - Player advantage, clutch scenarios
     # ============================================================================
     
-    def _apply_situational(self, df: pd.DataFrame, metric: Dict) -> pd.DataFrame:
+    def _apply_situational(self, df: pd.DataFrame, cols: EventColumns,
+                           metric: Dict) -> pd.DataFrame:
         """
         Apply situational metrics like clutch scenarios and player advantages.
         
         Example: At each kill event, calculate team_alive - enemy_alive
         """
         if metric['name'] == 'Clutch_Situations':
-            # Group by round and calculate alive counts at each event
-            df['players_alive_team'] = 0
-            df['players_alive_enemy'] = 0
-            df['situation_type'] = 'Unknown'
-            df['player_advantage'] = 0
+            # Deaths per side, accumulated within each round in gameTime order
+            # (enrich() sorts first, so the input row order does not matter;
+            # every round starts 5v5)
+            team_deaths = cols.is_kill & _label_mask(cols.victim_team, cols.team_labels, 'Team A')
+            enemy_deaths = cols.is_kill & _label_mask(cols.victim_team, cols.team_labels, 'Team B')
+            # A row with an unknown roundNumber falls in no group (NaN from
+            # cumsum): it counts as no deaths, keeping the counts integral
+            deaths = pd.DataFrame({'team': team_deaths, 'enemy': enemy_deaths}, dtype=int)
+            dead = deaths.groupby(cols.round).cumsum().fillna(0)
+            team = 5 - dead['team'].to_numpy(dtype=np.int64)
+            enemy = 5 - dead['enemy'].to_numpy(dtype=np.int64)
+            adv = team - enemy
             
-            # For each round, track alive players
-            for round_num in df['roundNumber'].unique():
-                round_mask = df['roundNumber'] == round_num
-                round_events = df[round_mask].copy()
-                
-                # Track alive players (start with 5v5)
-                team_alive = 5
-                enemy_alive = 5
-                
-                for idx in round_events.index:
-                    event = df.loc[idx]
-                    
-                    # Update alive count if this is a kill event
-                    if event.get('eventType') == 'kill':
-                        victim_team = event.get('victimTeam', '')
-                        killer_team = event.get('killerTeam', '')
-                        
-                        if victim_team == 'Team A':
-                            team_alive -= 1
-                        elif victim_team == 'Team B':
-                            enemy_alive -= 1
-                    
-                    # Record state
-                    df.at[idx, 'players_alive_team'] = team_alive
-                    df.at[idx, 'players_alive_enemy'] = enemy_alive
-                    df.at[idx, 'player_advantage'] = team_alive - enemy_alive
-                    
-                    # Classify situation
-                    advantage = team_alive - enemy_alive
-                    if advantage == 0:
-                        df.at[idx, 'situation_type'] = 'Even'
-                    elif advantage > 0:
-                        df.at[idx, 'situation_type'] = f'Advantage +{advantage}'
-                    else:
-                        df.at[idx, 'situation_type'] = f'Disadvantage {advantage}'
-                    
-                    # Special case: 1vX clutch situations
-                    if team_alive == 1 and enemy_alive > 1:
-                        df.at[idx, 'situation_type'] = f'Clutch 1v{enemy_alive}'
+            # Counts normally fit int8; to_numeric only narrows when they do
+            team, enemy, adv = (pd.to_numeric(a, downcast='integer') for a in (team, enemy, adv))
+            
+            # Classify situation; 1vX clutch takes precedence over the advantage.
+            # Codes index SITUATION_LABELS: advantage -5..+5 -> 0..10 and
+            # clutch 1v2..1v5 -> 11..14; anything outside the table (bad
+            # data) stays missing (-1)
+            clutch = (team == 1) & (enemy > 1)
+            plain = ~clutch & (adv >= -5) & (adv <= 5)
+            clutch &= enemy <= 5
+            codes = np.full(len(adv), -1, dtype=np.int8)
+            codes[plain] = adv[plain] + 5
+            codes[clutch] = enemy[clutch] + 9
+            
+            df['players_alive_team'] = team
+            df['players_alive_enemy'] = enemy
+            df['situation_type'] = pd.Categorical.from_codes(codes, categories=self.SITUATION_LABELS)
+            df['player_advantage'] = adv
         
         return df
     
@@ -132,7 +274,8 @@ class SemanticEnricher:
     # SPATIAL METRICS - Zone control, positioning analysis
     # ============================================================================
     
-    def _apply_spatial(self, df: pd.DataFrame, metric: Dict) -> pd.DataFrame:
+    def _apply_spatial(self, df: pd.DataFrame, cols: EventColumns,
+                       metric: Dict) -> pd.DataFrame:
         """
         Apply spatial metrics based on player positions.
         
@@ -145,42 +288,46 @@ class SemanticEnricher:
             
             # Create column for this zone
             column_name = f"in_zone_{zone_name.lower().replace(' ', '_')}"
-            df[column_name] = False
             
             # Check if player positions fall within bounds
-            if 'playerX' in df.columns and 'playerY' in df.columns:
-                mask = (
-                    (df['map'] == map_name) &
-                    (df['playerX'] >= bounds.get('x_min', -float('inf'))) &
-                    (df['playerX'] <= bounds.get('x_max', float('inf'))) &
-                    (df['playerY'] >= bounds.get('y_min', -float('inf'))) &
-                    (df['playerY'] <= bounds.get('y_max', float('inf')))
-                )
-                df.loc[mask, column_name] = True
+            if cols.px is not None and cols.py is not None:
+                x_min = bounds.get('x_min', -np.inf)
+                x_max = bounds.get('x_max', np.inf)
+                y_min = bounds.get('y_min', -np.inf)
+                y_max = bounds.get('y_max', np.inf)
+                x = cols.px
+                y = cols.py
+                
+                # One fused pass over plain arrays; NaN positions compare False
+                df[column_name] = np.logical_and.reduce([
+                    _label_mask(cols.map_codes, cols.map_labels, map_name),
+                    x >= x_min, x <= x_max,
+                    y >= y_min, y <= y_max,
+                ])
                 
                 # Calculate distance to zone center for proximity analysis
                 center_x = (bounds.get('x_min', 0) + bounds.get('x_max', 0)) / 2
                 center_y = (bounds.get('y_min', 0) + bounds.get('y_max', 0)) / 2
                 
-                df[f'distance_to_{zone_name.lower()}'] = df.apply(
-                    lambda row: self._calculate_distance(
-                        row.get('playerX', 0), row.get('playerY', 0),
-                        center_x, center_y
-                    ) if pd.notna(row.get('playerX')) else None,
-                    axis=1
-                )
+                # Vectorized over all rows; missing positions propagate as NaN
+                dx = x - center_x
+                dy = y - center_y
+                df[f'distance_to_{zone_name.lower()}'] = np.hypot(dx, dy)
+            else:
+                df[column_name] = False
         
         return df
     
     def _calculate_distance(self, x1: float, y1: float, x2: float, y2: float) -> float:
         """Calculate Euclidean distance between two points."""
-        return math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
+        return math.hypot(x2 - x1, y2 - y1)
     
     # ============================================================================
     # TEMPORAL METRICS - Trade kills, time-based patterns
     # ============================================================================
     
-    def _apply_temporal(self, df: pd.DataFrame, metric: Dict) -> pd.DataFrame:
+    def _apply_temporal(self, df: pd.DataFrame, cols: EventColumns,
+                        metric: Dict) -> pd.DataFrame:
         """
         Apply temporal metrics like trade kills.
         
@@ -189,47 +336,56 @@ class SemanticEnricher:
         - The kill happened within 15 meters of the teammate's death
         """
         if metric['name'] == 'Trade_Efficiency':
-            df['is_trade_kill'] = False
-            df['time_since_teammate_death'] = None
-            df['distance_to_teammate_death'] = None
+            # Rows are already in time order (sorted once in enrich())
+            kill_rows = np.flatnonzero(cols.is_kill)
+            kill_time = cols.time[kill_rows]
+            killer_team = cols.killer_team[kill_rows]
+            victim_team = cols.victim_team[kill_rows]
             
-            # Sort by time to process chronologically
-            df = df.sort_values('gameTime')
+            # Most recent teammate death strictly before each kill, in one
+            # sorted pass instead of a rescan of the frame per kill: its
+            # position in kill_rows, or -1 if there is none. A missing killer
+            # team (code -1) never matches. Kills without a gameTime (null keys
+            # would make merge_asof raise) sit out on both sides and never match.
+            timed = np.flatnonzero(~np.isnan(kill_time))
+            recent = pd.merge_asof(
+                pd.DataFrame({'gameTime': kill_time[timed], 'team': killer_team[timed]}),
+                pd.DataFrame({'deathTime': kill_time[timed], 'team': victim_team[timed],
+                              'death': timed}),
+                left_on='gameTime', right_on='deathTime', by='team',
+                direction='backward', allow_exact_matches=False
+            )
+            prev = np.full(len(kill_rows), -1)
+            prev[timed] = recent['death'].fillna(-1).to_numpy(dtype=np.int64)
+            prev[killer_team < 0] = -1
             
-            # For each kill event, check if it's a trade
-            kill_events = df[df['eventType'] == 'kill'].copy()
+            # Only deaths within the last 3 seconds count
+            death_rows = kill_rows[prev]
+            in_window = (prev >= 0) & (cols.time[death_rows] >= kill_time - 3.0)
+            rows = kill_rows[in_window]
+            source = death_rows[in_window]
             
-            for idx in kill_events.index:
-                kill_event = df.loc[idx]
-                killer_team = kill_event.get('killerTeam')
-                kill_time = kill_event.get('gameTime', 0)
-                kill_x = kill_event.get('killerX', 0)
-                kill_y = kill_event.get('killerY', 0)
-                
-                # Look back for recent teammate deaths
-                recent_deaths = df[
-                    (df['eventType'] == 'kill') &
-                    (df['victimTeam'] == killer_team) &
-                    (df['gameTime'] < kill_time) &
-                    (df['gameTime'] >= kill_time - 3.0)  # Within 3 seconds
-                ]
-                
-                if not recent_deaths.empty:
-                    # Get most recent teammate death
-                    last_death = recent_deaths.iloc[-1]
-                    death_x = last_death.get('victimX', 0)
-                    death_y = last_death.get('victimY', 0)
-                    
-                    # Calculate distance
-                    distance = self._calculate_distance(kill_x, kill_y, death_x, death_y)
-                    time_diff = kill_time - last_death.get('gameTime', 0)
-                    
-                    df.at[idx, 'time_since_teammate_death'] = time_diff
-                    df.at[idx, 'distance_to_teammate_death'] = distance
-                    
-                    # It's a trade if within 15 meters
-                    if distance <= 15.0:
-                        df.at[idx, 'is_trade_kill'] = True
+            if all(xy is not None for xy in (cols.kx, cols.ky, cols.vx, cols.vy)):
+                dx = cols.vx[source] - cols.kx[rows]
+                dy = cols.vy[source] - cols.ky[rows]
+                distance = np.hypot(dx, dy)
+            else:
+                # Positions not in this data (as in the spatial metric): the
+                # distance is unknown, so no kill can qualify as a trade
+                distance = np.full(len(rows), np.nan)
+            
+            # Scatter back onto the kill rows
+            time_since = np.full(len(df), np.nan)
+            time_since[rows] = cols.time[rows] - cols.time[source]
+            death_distance = np.full(len(df), np.nan)
+            death_distance[rows] = distance
+            is_trade = np.zeros(len(df), dtype=bool)
+            # It's a trade if within 15 meters
+            is_trade[rows] = distance <= 15.0
+            
+            df['is_trade_kill'] = is_trade
+            df['time_since_teammate_death'] = time_since
+            df['distance_to_teammate_death'] = death_distance
         
         return df
     
@@ -243,26 +399,20 @@ class SemanticEnricher:
         
         Example: "Exit Frag" - meaningless kill when round is already lost
         """
-        conditions = metric.get('conditions', {})
-        column_name = f"is_{metric['name'].lower().replace(' ', '_')}"
-        df[column_name] = True
-        
-        # Apply each condition as a filter
-        for condition_key, condition_value in conditions.items():
-            if isinstance(condition_value, list):
-                # List means "in these values"
-                df[column_name] &= df.get(condition_key, pd.Series()).isin(condition_value)
-            elif isinstance(condition_value, str) and condition_value.startswith('>'):
-                # Greater than comparison
-                threshold = float(condition_value[1:].strip())
-                df[column_name] &= df.get(condition_key, pd.Series()) > threshold
-            elif isinstance(condition_value, str) and condition_value.startswith('<'):
-                # Less than comparison
-                threshold = float(condition_value[1:].strip())
-                df[column_name] &= df.get(condition_key, pd.Series()) < threshold
-            else:
-                # Exact match
-                df[column_name] &= df.get(condition_key, pd.Series()) == condition_value
+        compiled = self._compiled_metrics[metric['name']]
+        ops = compiled['ops']
+        
+        # Dimension not present in this data: nothing can match
+        missing = [key for key, _ in ops if key not in df.columns]
+        if missing:
+            print(f"     ⚠ Missing columns, no rows match: {', '.join(missing)}")
+            df[compiled['column']] = False
+            return df
+        
+        # Build one ndarray mask per condition, then AND them in a single reduce
+        masks = [op(df[key]).to_numpy(dtype=bool, na_value=False) for key, op in ops]
+        df[compiled['column']] = (np.logical_and.reduce(masks) if masks
+                                  else np.ones(len(df), dtype=bool))
         
         return df
     
@@ -279,17 +429,20 @@ class SemanticEnricher:
             raise ValueError("No enriched data available. Run enrich() first.")
         
         insights = {}
+        data = self.enriched_data
+        
+        # Row positions and counts from boolean masks throughout: no filtered
+        # copy of the frame is materialized
         
         # Example: Market Defense Analysis
-        if 'in_zone_market_defense_(ascent)' in self.enriched_data.columns:
-            market_events = self.enriched_data[
-                self.enriched_data['in_zone_market_defense_(ascent)'] == True
-            ]
+        if 'in_zone_market_defense_(ascent)' in data.columns:
+            market_rows = np.flatnonzero(
+                (data['in_zone_market_defense_(ascent)'] == True).to_numpy()
+            )
             
-            if not market_events.empty:
+            if len(market_rows):
                 # Calculate win rate in Market zone
-                market_rounds = market_events.groupby('roundNumber')
-                total_rounds = len(market_rounds)
+                total_rounds = data['roundNumber'].take(market_rows).nunique()
                 
                 # Simplified win rate calculation
                 insights['market_defense'] = {
@@ -299,12 +452,9 @@ class SemanticEnricher:
                 }
         
         # Example: Trade Efficiency Analysis
-        if 'is_trade_kill' in self.enriched_data.columns:
-            trade_kills = self.enriched_data[
-                self.enriched_data['is_trade_kill'] == True
-            ]
-            total_kills = len(self.enriched_data[self.enriched_data['eventType'] == 'kill'])
-            trade_count = len(trade_kills)
+        if 'is_trade_kill' in data.columns:
+            total_kills = int((data['eventType'] == 'kill').sum())
+            trade_count = int((data['is_trade_kill'] == True).sum())
             
             if total_kills > 0:
                 trade_percentage = (trade_count / total_kills) * 100
@@ -316,15 +466,20 @@ class SemanticEnricher:
                 }
         
         # Example: Clutch Situations
-        if 'situation_type' in self.enriched_data.columns:
-            clutch_situations = self.enriched_data[
-                self.enriched_data['situation_type'].str.startswith('Clutch', na=False)
-            ]
+        if 'situation_type' in data.columns:
+            situation = data['situation_type']
+            if isinstance(situation.dtype, pd.CategoricalDtype):
+                clutch = startswith_mask(situation, 'Clutch')
+            else:
+                clutch = situation.str.startswith('Clutch', na=False).to_numpy(dtype=bool)
+            clutch_rows = np.flatnonzero(clutch)
             
-            if not clutch_situations.empty:
-                clutch_types = clutch_situations['situation_type'].value_counts()
+            if len(clutch_rows):
+                clutch_types = situation.take(clutch_rows).value_counts()
+                # A categorical also counts its unused (non-clutch) labels
+                clutch_types = clutch_types[clutch_types > 0]
                 insights['clutch_scenarios'] = {
-                    'total_clutch_situations': len(clutch_situations),
+                    'total_clutch_situations': len(clutch_rows),
                     'clutch_breakdown': clutch_types.to_dict(),
                     'description': 'Player disadvantage scenarios'
                 }
@@ -332,15 +487,23 @@ class SemanticEnricher:
         return insights
     
     def export_enriched_data(self, output_path: str):
-        """Export enriched data to CSV for inspection or LLM queries."""
+        """
+        Export enriched data for inspection or LLM queries.
+        A .parquet path writes zstd-compressed Parquet (requires pyarrow),
+        keeping categorical and narrowed dtypes; anything else writes CSV.
+        """
         if self.enriched_data is None:
             raise ValueError("No enriched data available. Run enrich() first.")
         
-        self.enriched_data.to_csv(output_path, index=False)
+        if Path(output_path).suffix == '.parquet':
+            self.enriched_data.to_parquet(output_path, engine='pyarrow',
+                                          compression='zstd', index=False)
+        else:
+            self.enriched_data.to_csv(output_path, index=False)
         print(f"\n✓ Enriched data exported to: {output_path}")
         print(f"  Rows: {len(self.enriched_data)}")
         print(f"  Columns: {len(self.enriched_data.columns)}")
-        print(f"  New dimensions added: {len(self.enriched_data.columns) - len(self.enriched_data.columns)}")
+        print(f"  New dimensions added: {len(self.enriched_data.columns) - len(self._original_columns)}")
     
     def generate_summary_report(self) -> str:
         """Generate a text summary of the enrichment process."""
@@ -384,7 +547,7 @@ def main():
     df = create_demo_data()
     
     # Enrich the data
-    enriched_df = enricher.enrich(df)
+    enriched_df = enricher.enrich(df, inplace=True)
     
     # Run analysis
     print("\n📊 Running analysis...")